@@ -0,0 +1,86 @@
+"""Persistent cache of Gemini results, keyed by a hash of each paper's content."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+
+from arxiv_recsys_llm_bot.config import GEMINI_CACHE_FILE, GEMINI_CACHE_TTL_DAYS, log
+from arxiv_recsys_llm_bot.models import Paper
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS results (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+)"""
+
+
+def paper_hash(p: Paper) -> str:
+    """Hash the fields Gemini sees, so any change to a paper misses the cache."""
+    h = hashlib.sha256()
+    for part in (p.title, "\x1f".join(p.authors), p.abstract, p.comment):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(GEMINI_CACHE_FILE)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def load_cached(kind: str, keys: Iterable[str]) -> dict[str, dict]:
+    """Return unexpired cached *kind* results for *keys* (missing keys are omitted)."""
+    keys = list(keys)
+    if not keys:
+        return {}
+
+    oldest = time.time() - GEMINI_CACHE_TTL_DAYS * 86400
+    found: dict[str, dict] = {}
+    try:
+        conn = _connect()
+        try:
+            conn.execute("DELETE FROM results WHERE created < ?", (oldest,))
+            conn.commit()
+            # Chunked to stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                rows = conn.execute(
+                    f"SELECT key, value FROM results WHERE kind = ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    (kind, *chunk),
+                )
+                for key, value in rows:
+                    found[key] = json.loads(value)
+        finally:
+            conn.close()
+    except (sqlite3.Error, json.JSONDecodeError) as e:
+        log.warning("Gemini cache read failed, ignoring cache: %s", e)
+        return {}
+
+    return found
+
+
+def store_cached(kind: str, entries: dict[str, dict]) -> None:
+    """Persist *kind* results for each key in *entries*."""
+    if not entries:
+        return
+
+    now = time.time()
+    try:
+        conn = _connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO results (kind, key, value, created) VALUES (?, ?, ?, ?)",
+                [(kind, key, json.dumps(value), now) for key, value in entries.items()],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        log.warning("Gemini cache write failed: %s", e)
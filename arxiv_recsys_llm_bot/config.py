@@ -2,7 +2,9 @@
 
 import logging
 import os
+import re
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 # ---------------------------------------------------------------------------
 # Environment-based configuration (no hardcoded secrets)
@@ -16,16 +18,46 @@ GMAIL_APP_PASSWORD = os.environ.get("GMAIL_APP_PASSWORD", "")
 # Max Gemini API calls allowed (hard cap)
 MAX_GEMINI_CALLS = int(os.environ.get("MAX_GEMINI_CALLS", "80"))
 
-# Papers per Gemini batch (to minimise API calls)
-BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "10"))
+# Classification batches are packed greedily up to an estimated input-token
+# budget (to minimise API calls), and never hold more than BATCH_SIZE papers
+BATCH_TOKENS = int(os.environ.get("BATCH_TOKENS", "6000"))
+BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "40"))
+
+# Gemini requests per minute, shared across concurrent batches
+GEMINI_RPM = int(os.environ.get("GEMINI_RPM", "10"))
+
+# Thinking tokens per Gemini request. Unset leaves the model's own (dynamic)
+# thinking alone. When set, it is added on top of each request's answer
+# budget, since thinking counts against max_output_tokens.
+_thinking_budget = os.environ.get("GEMINI_THINKING_BUDGET", "")
+GEMINI_THINKING_BUDGET = int(_thinking_budget) if _thinking_budget else None
+
+# Repository root. abspath is pure string work, unlike Path.resolve(), which
+# stats every path component at import time.
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # State file for tracking last run (no gap dates)
-STATE_FILE = Path(__file__).resolve().parent.parent / "state.json"
+STATE_FILE = PROJECT_ROOT / "state.json"
+
+# Local HTML/JSON reports, written on every run
+REPORTS_DIR = PROJECT_ROOT / "reports"
+
+# Timezone for report dates and the email subject. Loaded once, since each
+# ZoneInfo() lookup goes through the tz database.
+LOCAL_TZ = ZoneInfo("America/Los_Angeles")
+
+# Days of classified ArXiv IDs kept in state so overlapping lookback windows
+# don't re-fetch (and re-classify) papers a previous run already sent
+RECENT_IDS_DAYS = 14
+
+# Persistent cache of Gemini classifications/summaries, keyed by paper content
+GEMINI_CACHE_FILE = PROJECT_ROOT / "gemini_cache.sqlite"
+GEMINI_CACHE_TTL_DAYS = 30
 
 # ---------------------------------------------------------------------------
 # ArXiv search queries — RecSys + LLM research
 # ---------------------------------------------------------------------------
-SEARCH_QUERIES = [
+SEARCH_QUERIES = (
     # --- Recommendation Systems ---
     'all:"recommendation system" OR all:"recommender system"',
     'all:"collaborative filtering"',
@@ -48,18 +80,28 @@ SEARCH_QUERIES = [
 
     # --- LLM as Judge / Evaluator for ranking ---
     'all:"LLM" AND all:"relevance" AND all:"search"',
-]
+)
+
+# All of the above as one boolean query, so ArXiv dedups and paginates
+# server-side instead of us issuing one request per query.
+COMBINED_QUERY = "(" + ") OR (".join(SEARCH_QUERIES) + ")"
 
 # ---------------------------------------------------------------------------
 # HuggingFace Daily Papers — relevance filter keywords
 # ---------------------------------------------------------------------------
-HF_RELEVANCE_KEYWORDS = {
+HF_RELEVANCE_KEYWORDS = frozenset({
     "recommendation", "recommender", "retrieval", "ranking", "recsys",
     "collaborative filtering", "click-through", "ctr", "information retrieval",
     "llm", "large language model", "rag", "dense retrieval",
     "retrieval-augmented", "generative retrieval", "learning to rank",
     "search", "query", "re-ranking", "reranking", "neural retrieval",
-}
+})
+
+# All keywords as one compiled alternation, so a relevance check is a single
+# scan over the (lowercased) text instead of one substring scan per keyword.
+HF_RELEVANCE_PATTERN = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(HF_RELEVANCE_KEYWORDS, key=lambda k: (-len(k), k)))
+)
 
 # ---------------------------------------------------------------------------
 # Logging
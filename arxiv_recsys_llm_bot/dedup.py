@@ -3,6 +3,19 @@
 import re
 
 from arxiv_recsys_llm_bot.config import log
+from arxiv_recsys_llm_bot.models import Paper
+
+_ARXIV_URL_RE = re.compile(r"^https?://arxiv\.org/(abs|pdf)/")
+_VERSION_RE = re.compile(r"v\d+$")
+_DOI_URL_RE = re.compile(r"^https?://(dx\.)?doi\.org/")
+_LATEX_CMD_RE = re.compile(r"\\[a-zA-Z]+\{([^}]*)\}")
+
+# Normalized titles shorter than this are not used for matching (false positives)
+_MIN_TITLE_LEN = 30
+
+# Deletes every ASCII character except [a-z0-9 ] (input is lowercased first)
+_TITLE_KEEP = frozenset("abcdefghijklmnopqrstuvwxyz0123456789 ")
+_TITLE_TRANS = str.maketrans({c: None for c in range(128) if chr(c) not in _TITLE_KEEP})
 
 
 def normalize_arxiv_id(raw: str) -> str:
@@ -10,9 +23,9 @@ def normalize_arxiv_id(raw: str) -> str:
     if not raw:
         return ""
     # Strip URL prefixes like https://arxiv.org/abs/
-    raw = re.sub(r"^https?://arxiv\.org/(abs|pdf)/", "", raw)
+    raw = _ARXIV_URL_RE.sub("", raw)
     # Strip version suffix (e.g., v1, v2)
-    raw = re.sub(r"v\d+$", "", raw)
+    raw = _VERSION_RE.sub("", raw)
     return raw.strip()
 
 
@@ -20,91 +33,105 @@ def normalize_doi(raw: str) -> str:
     """Normalize a DOI: lowercase, strip URL prefix."""
     if not raw:
         return ""
-    raw = re.sub(r"^https?://(dx\.)?doi\.org/", "", raw)
+    raw = _DOI_URL_RE.sub("", raw)
     return raw.strip().lower()
 
 
 def normalize_title(title: str) -> str:
-    """Normalize a title for fuzzy matching: lowercase, strip non-alphanumeric."""
-    if not title:
+    """Normalize a title for fuzzy matching: lowercase, strip non-alphanumeric.
+
+    Returns "" for titles too short to be used as a dedup key; normalization
+    never lengthens a title, so these are skipped before any regex work.
+    """
+    if not title or len(title) < _MIN_TITLE_LEN:
         return ""
-    # Remove common LaTeX commands
-    title = re.sub(r"\\[a-zA-Z]+\{([^}]*)\}", r"\1", title)
-    title = re.sub(r"[{}\$\\]", "", title)
-    # Lowercase, keep only alphanumeric and spaces
-    title = re.sub(r"[^a-z0-9 ]", "", title.lower())
+    # Remove common LaTeX commands (the only case that still needs a regex)
+    title = _LATEX_CMD_RE.sub(r"\1", title)
+    # Lowercase, drop non-ASCII, keep only alphanumeric and spaces
+    title = title.lower().encode("ascii", "ignore").decode("ascii").translate(_TITLE_TRANS)
     # Collapse whitespace
-    title = re.sub(r"\s+", " ", title).strip()
-    return title
+    return " ".join(title.split())
 
 
-def _merge_paper(existing: dict, new: dict) -> None:
+def _merge_paper(existing: Paper, new: Paper) -> None:
     """Merge metadata from *new* into *existing* (in-place)."""
     # Keep longer abstract
-    if len(new.get("abstract", "")) > len(existing.get("abstract", "")):
-        existing["abstract"] = new["abstract"]
-
-    # Union sources
-    ex_sources = set(existing.get("source", "").split(","))
-    new_sources = set(new.get("source", "").split(","))
-    existing["source"] = ",".join(sorted((ex_sources | new_sources) - {""}))
+    if len(new.abstract) > len(existing.abstract):
+        existing.abstract = new.abstract
+
+    # Union sources (kept as a sorted, comma-separated list)
+    ex_source, new_source = existing.source, new.source
+    if "," not in ex_source and "," not in new_source:
+        # Fast path: both are single tokens, the common case
+        if new_source and new_source != ex_source:
+            existing.source = ",".join(sorted((ex_source, new_source))) if ex_source else new_source
+    else:
+        ex_sources = set(ex_source.split(","))
+        new_sources = set(new_source.split(","))
+        existing.source = ",".join(sorted((ex_sources | new_sources) - {""}))
 
     # Carry over HF upvotes
-    if new.get("hf_upvotes", 0) > existing.get("hf_upvotes", 0):
-        existing["hf_upvotes"] = new["hf_upvotes"]
+    if new.hf_upvotes > existing.hf_upvotes:
+        existing.hf_upvotes = new.hf_upvotes
 
     # Carry over DOI if missing
-    if new.get("doi") and not existing.get("doi"):
-        existing["doi"] = new["doi"]
+    if new.doi and not existing.doi:
+        existing.doi = new.doi
 
     # Carry over categories if empty
-    if new.get("categories") and not existing.get("categories"):
-        existing["categories"] = new["categories"]
+    if new.categories and not existing.categories:
+        existing.categories = new.categories
 
 
-def deduplicate_papers(papers: list[dict]) -> list[dict]:
+def deduplicate_papers(papers: list[Paper]) -> list[Paper]:
     """Deduplicate papers using ArXiv ID, DOI, and normalized title.
 
     Papers should be ordered by source priority (ArXiv first, then HF).
     The first occurrence is kept as the primary record; later duplicates are merged in.
     """
-    seen_arxiv: dict[str, int] = {}   # normalized arxiv_id -> index in result
-    seen_doi: dict[str, int] = {}     # normalized doi -> index in result
-    seen_title: dict[str, int] = {}   # normalized title -> index in result
-    result: list[dict] = []
+    if len(papers) <= 1:
+        return list(papers)
+
+    # Single index for all three layers; keys are prefixed by layer
+    # ("a:" arxiv_id, "d:" doi, "t:" normalized title) -> index in result
+    seen: dict[str, int] = {}
+    result: list[Paper] = []
 
     for paper in papers:
         # Layer 1: ArXiv ID
-        arxiv_id = normalize_arxiv_id(paper.get("id", ""))
-        if arxiv_id:
-            if arxiv_id in seen_arxiv:
-                _merge_paper(result[seen_arxiv[arxiv_id]], paper)
+        arxiv_id = normalize_arxiv_id(paper.id)
+        arxiv_key = "a:" + arxiv_id if arxiv_id else ""
+        if arxiv_key:
+            match = seen.get(arxiv_key)
+            if match is not None:
+                _merge_paper(result[match], paper)
                 continue
 
         # Layer 2: DOI
-        doi = normalize_doi(paper.get("doi", ""))
-        if doi:
-            if doi in seen_doi:
-                _merge_paper(result[seen_doi[doi]], paper)
+        doi = normalize_doi(paper.doi)
+        doi_key = "d:" + doi if doi else ""
+        if doi_key:
+            match = seen.get(doi_key)
+            if match is not None:
+                _merge_paper(result[match], paper)
                 continue
 
-        # Layer 3: Normalized title (skip very short titles to avoid false positives)
-        norm_title = normalize_title(paper.get("title", ""))
-        if len(norm_title) >= 30:
-            if norm_title in seen_title:
-                _merge_paper(result[seen_title[norm_title]], paper)
+        # Layer 3: Normalized title (skip very short titles to avoid false positives).
+        # Only reached when layers 1-2 missed, so matched papers never pay for it.
+        norm_title = normalize_title(paper.title)
+        title_key = "t:" + norm_title if len(norm_title) >= _MIN_TITLE_LEN else ""
+        if title_key:
+            match = seen.get(title_key)
+            if match is not None:
+                _merge_paper(result[match], paper)
                 continue
 
         # Not a duplicate — add to result
         idx = len(result)
         result.append(paper)
-
-        if arxiv_id:
-            seen_arxiv[arxiv_id] = idx
-        if doi:
-            seen_doi[doi] = idx
-        if len(norm_title) >= 30:
-            seen_title[norm_title] = idx
+        for key in (arxiv_key, doi_key, title_key):
+            if key:
+                seen[key] = idx
 
     deduped = len(papers) - len(result)
     log.info("Dedup: %d papers in, %d unique out (%d duplicates removed)",
@@ -1,75 +1,181 @@
-"""Fetch recent RecSys & LLM papers from ArXiv."""
+"""Fetch recent RecSys & LLM papers from the ArXiv Atom API."""
 
-import re
 import time
+import xml.etree.ElementTree as ET
+from collections.abc import Collection
 from datetime import datetime, timezone
 
-import arxiv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from arxiv_recsys_llm_bot.config import SEARCH_QUERIES, log
+from arxiv_recsys_llm_bot.config import COMBINED_QUERY, log
+from arxiv_recsys_llm_bot.models import Paper, clean_text
 
-# Seconds to wait between queries to avoid ArXiv 429 rate limits.
-QUERY_DELAY = 10.0
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+PAGE_SIZE = 100
+MAX_RESULTS = 2000
 
+# Seconds between page requests, plus the retry backoff base.
+REQUEST_DELAY = 5.0
+NUM_RETRIES = 5
+# The API sometimes answers 200 with an empty or short page mid-results;
+# re-request such a page this many times before giving up on the rest.
+SHORT_PAGE_RETRIES = 3
 
-def fetch_recent_papers(cutoff: datetime) -> list[dict]:
-    """Fetch recent RecSys & LLM papers from arxiv since *cutoff*."""
-    client = arxiv.Client(page_size=100, delay_seconds=5.0, num_retries=5)
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+_ENTRY_TAG = f"{_ATOM}entry"
+_TOTAL_RESULTS_TAG = f"{_OPENSEARCH}totalResults"
 
-    seen_ids: set[str] = set()
-    papers: list[dict] = []
 
-    for qi, query in enumerate(SEARCH_QUERIES):
-        log.info("ArXiv query %d/%d: %s", qi + 1, len(SEARCH_QUERIES), query)
+def _paper_id(entry_id: str) -> str:
+    """Extract the versionless paper ID from an Atom entry ID URL.
 
-        try:
-            search = arxiv.Search(
-                query=query,
-                max_results=100,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
-            )
-            for result in client.results(search):
-                paper_id = result.entry_id.split("/abs/")[-1]
-                # Strip version suffix (e.g., v1, v2) for consistent dedup
-                paper_id = re.sub(r"v\d+$", "", paper_id)
-                if paper_id in seen_ids:
-                    continue
-                seen_ids.add(paper_id)
-
-                # Use `published` (original submission date) for filtering,
-                # matching the sort order (SubmittedDate).
-                paper_date = result.published
-                if paper_date.tzinfo is None:
-                    paper_date = paper_date.replace(tzinfo=timezone.utc)
-                if paper_date < cutoff:
-                    break  # Sorted descending by SubmittedDate, so stop here
-
-                papers.append(
-                    {
-                        "id": paper_id,
-                        "title": result.title.replace("\n", " ").strip(),
-                        "authors": [a.name for a in result.authors],
-                        "abstract": result.summary.replace("\n", " ").strip(),
-                        "categories": list(result.categories),
-                        "published": result.published.strftime("%Y-%m-%d"),
-                        "url": result.entry_id,
-                        "pdf_url": result.pdf_url,
-                        "comment": (result.comment or "").replace("\n", " ").strip(),
-                        "source": "arxiv",
-                    }
+    e.g. ``http://arxiv.org/abs/2401.01234v2`` -> ``2401.01234``. Old-style
+    IDs like ``cs/0101001v1`` keep their archive prefix.
+    """
+    abs_at = entry_id.rfind("/abs/")
+    tail = entry_id[abs_at + 5:] if abs_at >= 0 else entry_id
+    # Strip version suffix (e.g., v1, v2) for consistent dedup
+    head, sep, version = tail.rpartition("v")
+    return head if sep and version.isdigit() else tail
+
+
+def _make_session() -> requests.Session:
+    """Create a session that retries rate-limited and failed ArXiv requests."""
+    retry = Retry(
+        total=NUM_RETRIES,
+        backoff_factor=REQUEST_DELAY,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+def _fetch_page(
+    session: requests.Session,
+    start: int,
+    cutoff: datetime,
+    seen_ids: set[str],
+    skip_ids: Collection[str],
+    papers: list[Paper],
+) -> tuple[int, bool, int | None]:
+    """Fetch one result page into *papers*.
+
+    Returns ``(entries, reached_cutoff, total_results)``: the number of
+    entries on the page, whether an entry older than *cutoff* was reached,
+    and the feed's ``opensearch:totalResults`` (None if absent).
+    """
+    params = {
+        "search_query": COMBINED_QUERY,
+        "start": start,
+        "max_results": PAGE_SIZE,
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+    }
+    entries = 0
+    total_results = None
+
+    resp = session.get(ARXIV_API_URL, params=params, stream=True, timeout=60)
+    try:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        # Stream-parse the Atom feed, clearing each entry once consumed
+        for _, elem in ET.iterparse(resp.raw, events=("end",)):
+            if elem.tag == _TOTAL_RESULTS_TAG:
+                text = (elem.text or "").strip()
+                total_results = int(text) if text.isdigit() else None
+                continue
+            if elem.tag != _ENTRY_TAG:
+                continue
+            entries += 1
+
+            entry_id = elem.findtext(f"{_ATOM}id", "")
+            paper_id = _paper_id(entry_id)
+
+            # Use `published` (original submission date) for filtering,
+            # matching the sort order (submittedDate).
+            try:
+                paper_date = datetime.fromisoformat(elem.findtext(f"{_ATOM}published", ""))
+            except ValueError:
+                log.warning("Skipping ArXiv entry %r with a malformed published date", entry_id)
+                elem.clear()
+                continue
+            if paper_date.tzinfo is None:
+                paper_date = paper_date.replace(tzinfo=timezone.utc)
+            if paper_date < cutoff:
+                return entries, True, total_results  # Sorted descending, so stop here
+
+            # Skip papers delivered by a recent run, and entries that shifted
+            # across a page boundary, before materializing any other field.
+            if not paper_id or paper_id in skip_ids or paper_id in seen_ids:
+                elem.clear()
+                continue
+            seen_ids.add(paper_id)
+
+            papers.append(
+                Paper(
+                    id=paper_id,
+                    title=clean_text(elem.findtext(f"{_ATOM}title")),
+                    authors=[a.findtext(f"{_ATOM}name", "")
+                             for a in elem.iterfind(f"{_ATOM}author")],
+                    abstract=clean_text(elem.findtext(f"{_ATOM}summary")),
+                    categories=[c.get("term", "") for c in elem.iterfind(f"{_ATOM}category")],
+                    published=paper_date.date().isoformat(),
+                    url=entry_id,
+                    pdf_url=entry_id.replace("/abs/", "/pdf/"),
+                    comment=clean_text(elem.findtext(f"{_ARXIV}comment")),
+                    source="arxiv",
                 )
-        except arxiv.HTTPError as e:
-            log.warning("ArXiv rate-limited on query %d/%d (HTTP %s), skipping: %s",
-                        qi + 1, len(SEARCH_QUERIES), e.status, query)
-        except Exception as e:
-            log.warning("ArXiv query %d/%d failed (%s), skipping: %s",
-                        qi + 1, len(SEARCH_QUERIES), e, query)
+            )
+            elem.clear()
+    finally:
+        resp.close()
+
+    return entries, False, total_results
+
 
-        # Wait between queries to respect ArXiv rate limits
-        if qi < len(SEARCH_QUERIES) - 1:
-            log.info("Waiting %.0fs before next query...", QUERY_DELAY)
-            time.sleep(QUERY_DELAY)
+def fetch_recent_papers(cutoff: datetime, skip_ids: Collection[str] = frozenset()) -> list[Paper]:
+    """Fetch recent RecSys & LLM papers from arxiv since *cutoff*.
+
+    Papers whose ID is in *skip_ids* (already delivered by a previous run)
+    are left out.
+    """
+    session = _make_session()
+    seen_ids: set[str] = set()
+    papers: list[Paper] = []
+
+    for start in range(0, MAX_RESULTS, PAGE_SIZE):
+        try:
+            for attempt in range(SHORT_PAGE_RETRIES + 1):
+                if start or attempt:
+                    time.sleep(REQUEST_DELAY)
+                log.info("ArXiv page %d (results %d-%d)", start // PAGE_SIZE + 1, start, start + PAGE_SIZE - 1)
+                entries, done, total = _fetch_page(session, start, cutoff, seen_ids, skip_ids, papers)
+                # A short page is only the real end once totalResults says so
+                if done or entries == PAGE_SIZE or (total is not None and start + entries >= total):
+                    break
+                log.warning("ArXiv returned a short page (%d entries) at %d, retrying (%d/%d)",
+                            entries, start, attempt + 1, SHORT_PAGE_RETRIES)
+            else:
+                log.warning("ArXiv page starting at %d still short after %d retries, stopping",
+                            start, SHORT_PAGE_RETRIES)
+                break
+        except requests.HTTPError as e:
+            log.warning("ArXiv rate-limited on page starting at %d (HTTP %s), stopping",
+                        start, e.response.status_code)
+            break
+        except Exception as e:
+            log.warning("ArXiv page starting at %d failed (%s), stopping", start, e)
+            break
+        if done or entries < PAGE_SIZE:
+            break
+    else:
+        log.warning("Reached ArXiv result cap (%d) before the cutoff", MAX_RESULTS)
 
     log.info("Fetched %d unique papers since %s", len(papers), cutoff.date())
     return papers
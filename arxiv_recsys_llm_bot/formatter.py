@@ -2,33 +2,36 @@
 
 import html
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+
+from arxiv_recsys_llm_bot.config import LOCAL_TZ
+from arxiv_recsys_llm_bot.models import Paper
 
 
 def format_email_html(
-    industry_papers: list[dict],
+    industry_papers: list[Paper],
     all_papers_count: int,
     cutoff: datetime,
 ) -> str:
     """Create a nicely formatted HTML email."""
-    today = datetime.now(ZoneInfo("America/Los_Angeles")).strftime("%B %d, %Y")
+    today = datetime.now(LOCAL_TZ).strftime("%B %d, %Y")
     since = cutoff.strftime("%b %d")
 
-    papers_html = ""
+    cards: list[str] = []
     for i, p in enumerate(industry_papers, 1):
-        authors_raw = ", ".join(p["authors"][:8])
-        if len(p["authors"]) > 8:
-            authors_raw += f" ... (+{len(p['authors']) - 8} more)"
-
-        # HTML-escape all user-controlled strings
-        title_safe = html.escape(p["title"])
-        authors_safe = html.escape(authors_raw)
-        company_safe = html.escape(p.get("company", ""))
-        summary_safe = html.escape(p.get("summary", ""))
-        categories_safe = html.escape(", ".join(p.get("categories", [])))
-        published_safe = html.escape(p.get("published", ""))
-        url_safe = html.escape(p.get("url", ""))
-        pdf_safe = html.escape(p.get("pdf_url", p.get("url", "")))
+        authors_raw = ", ".join(p.authors[:8])
+        if len(p.authors) > 8:
+            authors_raw += f" ... (+{len(p.authors) - 8} more)"
+
+        # HTML-escape all user-controlled strings. Text content only needs
+        # &, <, > escaped; quotes matter only inside attribute values.
+        title_safe = html.escape(p.title, quote=False)
+        authors_safe = html.escape(authors_raw, quote=False)
+        company_safe = html.escape(p.company, quote=False)
+        summary_safe = html.escape(p.summary, quote=False)
+        categories_safe = html.escape(", ".join(p.categories), quote=False)
+        published_safe = html.escape(p.published, quote=False)
+        url_safe = html.escape(p.url)
+        pdf_safe = html.escape(p.pdf_url) if p.pdf_url else url_safe
 
         # Company badge — shown prominently when available
         company_html = ""
@@ -41,15 +44,15 @@ def format_email_html(
 
         # HF trending badge — shown when paper has HuggingFace upvotes
         hf_html = ""
-        hf_upvotes = p.get("hf_upvotes", 0)
-        if hf_upvotes and hf_upvotes > 0:
+        hf_upvotes = p.hf_upvotes
+        if hf_upvotes > 0:
             hf_html = (
                 f'<span style="background: #fce7f3; color: #9d174d; font-size: 11px;'
                 f' padding: 2px 8px; border-radius: 10px; margin-left: 4px;'
                 f' font-weight: 600;">&#x1F525; {hf_upvotes} HF</span>'
             )
 
-        papers_html += f"""
+        cards.append(f"""
         <tr>
             <td style="padding: 16px 20px; border-bottom: 1px solid #e5e7eb;">
                 <div style="margin-bottom: 6px;">
@@ -77,8 +80,9 @@ def format_email_html(
                               font-size: 12px; text-decoration: none;">PDF</a>
                 </div>
             </td>
-        </tr>"""
+        </tr>""")
 
+    papers_html = "".join(cards)
     if not papers_html:
         papers_html = """
         <tr>
@@ -1,17 +1,85 @@
 """Gemini-based paper classification and summary generation."""
 
+import itertools
 import json
+import random
+import re
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TypeVar
 
+import orjson
 from google import genai
-from google.genai import types
-
-from arxiv_recsys_llm_bot.config import BATCH_SIZE, GEMINI_MODEL, MAX_GEMINI_CALLS, log
+from google.genai import errors, types
+
+from arxiv_recsys_llm_bot.cache import load_cached, paper_hash, store_cached
+from arxiv_recsys_llm_bot.config import (
+    BATCH_SIZE,
+    BATCH_TOKENS,
+    GEMINI_MODEL,
+    GEMINI_RPM,
+    GEMINI_THINKING_BUDGET,
+    MAX_GEMINI_CALLS,
+    log,
+)
+from arxiv_recsys_llm_bot.models import Paper, clean_text
+
+_T = TypeVar("_T")
+
+# Classification batches in flight at once (the rate limiter still applies)
+MAX_CONCURRENT_BATCHES = 8
+
+# Retries for rate-limited (429) or overloaded (503) requests. The wait is the
+# server's RetryInfo delay when it sends one, else exponential with jitter.
+GEMINI_RETRIES = 4
+RETRY_BASE_DELAY = 2.0
+_RETRY_STATUS_CODES = {429, 503}
+
+# Output-token budget per request: a fixed allowance for the JSON array plus
+# room for each element (a classification is under ~80 tokens, a 2-3
+# sentence summary about 130), on top of GEMINI_THINKING_BUDGET. With
+# thinking left to the model its use is unbounded, so the *_DEFAULT_TOKENS
+# budgets stand in for it. Hitting the cap is logged so these can be tuned.
+CLASSIFICATION_BASE_TOKENS = 64
+CLASSIFICATION_TOKENS_PER_PAPER = 90
+CLASSIFICATION_DEFAULT_TOKENS = 4096
+SUMMARY_BASE_TOKENS = 48
+SUMMARY_TOKENS_PER_PAPER = 130
+SUMMARY_DEFAULT_TOKENS = 8192
+MAX_OUTPUT_TOKENS = 8192
+
+# Batch API (--batch): seconds between job status polls, and the longest a
+# run's jobs (classification, then summaries) may take together. Past that a
+# job is cancelled and its requests go out synchronously instead; keep it
+# well under the workflow's timeout-minutes.
+BATCH_POLL_INTERVAL = 30
+BATCH_JOBS_TIMEOUT = 2 * 60 * 60
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+# Monotonic time the Batch API jobs must finish by, set when the first is submitted
+_batch_deadline: float | None = None
 
 # ---------------------------------------------------------------------------
 # Classification prompt
 # ---------------------------------------------------------------------------
-CLASSIFICATION_SYSTEM_PROMPT = """\
+INDUSTRY_COMPANIES = (
+    "Google", "DeepMind", "Meta", "FAIR", "Amazon", "AWS", "Microsoft", "MSR",
+    "Apple", "Netflix", "Spotify", "Alibaba", "Ant Group", "Tencent",
+    "ByteDance", "TikTok", "Douyin", "Huawei", "JD.com", "Baidu", "LinkedIn",
+    "Pinterest", "Uber", "Airbnb", "eBay", "Yahoo", "Snap", "Twitter/X",
+    "NVIDIA", "Samsung", "Adobe", "Salesforce", "Kuaishou", "Meituan",
+    "Shopee", "Grab", "Yandex", "Criteo", "Booking", "PayPal", "Bloomberg",
+    "IBM Research", "Walmart", "Instacart", "DoorDash", "Lyft", "Roku", "Etsy",
+    "Cohere", "OpenAI", "Anthropic", "Mistral", "AI21 Labs", "Character.AI",
+)
+
+CLASSIFICATION_SYSTEM_PROMPT = f"""\
 You are an expert at classifying whether academic papers come from industry or academia.
 
 Given a batch of papers with their metadata, classify each one.
@@ -28,13 +96,7 @@ recommendation systems, information retrieval, NLP, and LLM research.
    - Phrases like "deployed at", "A/B test", "serving N million users", "production"
    - Results on proprietary/internal datasets or live traffic experiments
 
-3. **Common industry companies** (non-exhaustive): Google, DeepMind, Meta, FAIR, \
-Amazon, AWS, Microsoft, MSR, Apple, Netflix, Spotify, Alibaba, Ant Group, Tencent, \
-ByteDance, TikTok, Douyin, Huawei, JD.com, Baidu, LinkedIn, Pinterest, Uber, \
-Airbnb, eBay, Yahoo, Snap, Twitter/X, NVIDIA, Samsung, Adobe, Salesforce, \
-Kuaishou, Meituan, Shopee, Grab, Yandex, Criteo, Booking, PayPal, Bloomberg, \
-IBM Research, Walmart, Instacart, DoorDash, Lyft, Roku, Etsy, Cohere, \
-OpenAI, Anthropic, Mistral, AI21 Labs, Character.AI, etc.
+3. **Common industry companies** (non-exhaustive): {", ".join(INDUSTRY_COMPANIES)}, etc.
 
 4. **Default to "academia"** when there are no industry signals at all.
 
@@ -42,176 +104,730 @@ OpenAI, Anthropic, Mistral, AI21 Labs, Character.AI, etc.
 
 ## Output format:
 Respond with ONLY a JSON array. Each element:
-  {"paper_index": <int>, "classification": "industry"|"academia"|"unknown", \
+  {{"paper_index": <int>, "classification": "industry"|"academia"|"unknown", \
 "company": "<specific company name(s) separated by commas if industry, empty string otherwise>", \
-"reason": "<brief reason for classification>"}
+"reason": "<brief reason for classification>"}}
 """
 
+# Gemini implicitly caches repeated request prefixes (system instruction
+# first, then contents), so everything static lives in the system prompts and
+# these fixed lead-ins; per-call paper blocks are always a pure suffix.
+CLASSIFICATION_USER_PREFIX = "Classify each paper below as industry or academia.\n\n"
 
-def classify_papers_with_gemini(
-    papers: list[dict],
-    gemini_client: genai.Client,
-    call_counter: dict,
-    max_calls: int = MAX_GEMINI_CALLS,
-) -> list[dict]:
-    """Classify papers in batches using Gemini. Modifies papers in-place."""
-    total = len(papers)
-    if total == 0:
-        return papers
+# ---------------------------------------------------------------------------
+# Summary prompt
+# ---------------------------------------------------------------------------
+SUMMARY_SYSTEM_PROMPT = """\
+You write short summaries of industry research papers for a daily digest.
 
-    for batch_start in range(0, total, BATCH_SIZE):
-        if call_counter["count"] >= max_calls:
-            log.warning(
-                "Reached Gemini call limit (%d). Remaining papers left unclassified.",
-                max_calls,
-            )
-            break
-
-        batch = papers[batch_start : batch_start + BATCH_SIZE]
-        prompt_parts = []
-        for i, p in enumerate(batch):
-            authors_str = ", ".join(p["authors"][:15])
-            abstract_snippet = p["abstract"][:400]
-
-            prompt_parts.append(
-                f"Paper {i}:\n"
-                f"  Title: {p['title']}\n"
-                f"  Authors: {authors_str}\n"
-                f"  Abstract: {abstract_snippet}\n"
-                f"  Comment: {p.get('comment', '')}\n"
-            )
+For each paper, write a 2-3 sentence summary highlighting the key contribution \
+and why it matters for recommendation systems, information retrieval, or LLM \
+research. Focus on practical implications.
 
-        prompt = (
-            "Classify each paper below as industry or academia.\n\n"
-            + "\n".join(prompt_parts)
-        )
+## Output format:
+Respond with ONLY a JSON array. Each element:
+  {"paper_index": <int>, "summary": "<2-3 sentence summary>"}
+"""
+
+SUMMARY_USER_PREFIX = "Summarize each paper below.\n\n"
+
+# ---------------------------------------------------------------------------
+# Pre-classification: comments that plainly state an industry affiliation
+# ---------------------------------------------------------------------------
+# A company email domain is the only evidence trusted without Gemini. Company
+# names are also datasets, tools and sponsors ("Criteo dataset", "Google
+# Drive"), so one only counts in affiliation wording, and even then it is just
+# passed to Gemini as a hint.
+_COMPANY_NAMES = "|".join(
+    re.escape(name)
+    for name in sorted(
+        {name.split("/")[0] for name in INDUSTRY_COMPANIES},
+        key=lambda name: (-len(name), name),
+    )
+)
+_ORG_SUFFIX = r"(?:Inc|Research|Labs?|AI\s+Labs?|Corp(?:oration)?|Ltd)\b"
+# The organisation's name must end there: punctuation, the end of the comment
+# or a connective, never more words ("Amazon Research Award", "Google
+# Research Scholar Program", "at Google scale" are sponsors and phrases)
+_NAME_END = (
+    r"(?=\s*[,;:.()/&]|\s*$"
+    r"|\s+(?:and|or|while|during|in|as|with|from|on|to|when|for|under|via)\b)"
+)
+# Case-insensitive wording but case-sensitive names; a hyphen counts as part of the word ("Meta-learning")
+_AFFILIATION_RE = re.compile(
+    r"(?i:\b(?:work(?:\s+was)?\s+done|conducted|performed)\s+(?:\w+\s+){0,5}?at"
+    r"|\baffiliated\s+with|\bemployed\s+(?:at|by))\s+(?:the\s+)?"
+    rf"(?P<after>{_COMPANY_NAMES})(?:\s+(?:{_ORG_SUFFIX}|DeepMind\b))?{_NAME_END}"
+    rf"|(?<![\w-])(?P<before>{_COMPANY_NAMES})\s+{_ORG_SUFFIX}{_NAME_END}"
+)
+
+_COMPANY_EMAIL_DOMAINS = {
+    "google.com": "Google", "deepmind.com": "DeepMind", "meta.com": "Meta",
+    "fb.com": "Meta", "amazon.com": "Amazon", "microsoft.com": "Microsoft",
+    "apple.com": "Apple", "netflix.com": "Netflix", "spotify.com": "Spotify",
+    "alibaba-inc.com": "Alibaba", "antgroup.com": "Ant Group", "tencent.com": "Tencent",
+    "bytedance.com": "ByteDance", "huawei.com": "Huawei", "jd.com": "JD.com",
+    "baidu.com": "Baidu", "linkedin.com": "LinkedIn", "pinterest.com": "Pinterest",
+    "uber.com": "Uber", "airbnb.com": "Airbnb", "ebay.com": "eBay",
+    "yahoo-inc.com": "Yahoo", "snap.com": "Snap", "nvidia.com": "NVIDIA",
+    "samsung.com": "Samsung", "adobe.com": "Adobe", "salesforce.com": "Salesforce",
+    "kuaishou.com": "Kuaishou", "meituan.com": "Meituan", "shopee.com": "Shopee",
+    "grab.com": "Grab", "yandex-team.ru": "Yandex", "criteo.com": "Criteo",
+    "booking.com": "Booking", "paypal.com": "PayPal", "bloomberg.net": "Bloomberg",
+    "ibm.com": "IBM Research", "walmart.com": "Walmart", "instacart.com": "Instacart",
+    "doordash.com": "DoorDash", "lyft.com": "Lyft", "roku.com": "Roku",
+    "etsy.com": "Etsy", "cohere.com": "Cohere", "openai.com": "OpenAI",
+    "anthropic.com": "Anthropic", "mistral.ai": "Mistral", "ai21.com": "AI21 Labs",
+    "character.ai": "Character.AI",
+}
+_EMAIL_DOMAIN_RE = re.compile(r"@([A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+)")
+
+# Any academic affiliation (or an internship) means mixed authorship: Gemini decides
+_ACADEMIC_RE = re.compile(r"universit|institut|college|academ|school of|intern\b|internship", re.IGNORECASE)
+# Academic email domains: cs.stanford.edu, ox.ac.uk, tsinghua.edu.cn
+_ACADEMIC_DOMAIN_RE = re.compile(r"(?:^|\.)(?:edu|ac\.[a-z]{2}|edu\.[a-z]{2})$", re.IGNORECASE)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that paces requests to *per_minute*."""
+
+    def __init__(self, per_minute: int, capacity: int = 1) -> None:
+        self._rate = per_minute / 60.0
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# Shared by every Gemini request in the process. Capacity 1 means no bursts,
+# so no 60s window ever exceeds GEMINI_RPM.
+_RATE_LIMITER = _TokenBucket(GEMINI_RPM)
+
+# Guards call_counter updates from concurrent classification batches
+_COUNTER_LOCK = threading.Lock()
+
+
+def _count_call(call_counter: dict) -> None:
+    """Increment the shared Gemini call counter."""
+    with _COUNTER_LOCK:
+        call_counter["count"] += 1
 
-        log.info(
-            "Gemini call %d: classifying papers %d-%d of %d",
-            call_counter["count"] + 1,
-            batch_start,
-            batch_start + len(batch) - 1,
-            total,
-        )
 
-        response = None
+def _pack_batches(papers: list[Paper], blocks: dict[int, str]) -> list[list[Paper]]:
+    """Greedily pack *papers* into batches of about BATCH_TOKENS input tokens.
+
+    Each paper's tokens are estimated from its rendered block in *blocks*
+    (keyed by ``id(paper)``) at ~4 chars per token. A batch is closed once
+    its estimate reaches BATCH_TOKENS or it holds BATCH_SIZE papers,
+    whichever comes first.
+    """
+    batches: list[list[Paper]] = []
+    batch: list[Paper] = []
+    tokens = 0
+    for p in papers:
+        batch.append(p)
+        tokens += len(blocks[id(p)]) // 4
+        if tokens >= BATCH_TOKENS or len(batch) >= BATCH_SIZE:
+            batches.append(batch)
+            batch, tokens = [], 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _retry_delay(err: errors.APIError, attempt: int) -> float:
+    """Seconds to wait before retrying after *err* on zero-based *attempt*."""
+    try:
+        for detail in err.details["error"]["details"]:
+            if detail.get("@type", "").endswith("google.rpc.RetryInfo"):
+                return float(detail["retryDelay"].rstrip("s"))
+    except (KeyError, TypeError, ValueError, AttributeError):
+        pass
+    return RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, RETRY_BASE_DELAY)
+
+
+def _call_with_retries(call: Callable[[], _T]) -> _T:
+    """Rate-limit *call* and retry it, backing off only on 429/503."""
+    for attempt in range(GEMINI_RETRIES + 1):
+        _RATE_LIMITER.acquire()
         try:
-            response = gemini_client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    system_instruction=CLASSIFICATION_SYSTEM_PROMPT,
-                    temperature=0.0,
-                    max_output_tokens=4096,
-                    response_mime_type="application/json",
-                ),
-            )
-            call_counter["count"] += 1
+            return call()
+        except errors.APIError as e:
+            if e.code not in _RETRY_STATUS_CODES or attempt == GEMINI_RETRIES:
+                raise
+            delay = _retry_delay(e, attempt)
+            log.warning("Gemini returned %s, retrying in %.1fs (%d/%d)",
+                        e.code, delay, attempt + 1, GEMINI_RETRIES)
+            time.sleep(delay)
+
+
+def _output_budget(base: int, per_paper: int, n_papers: int, default: int) -> int:
+    """max_output_tokens for a request answering about *n_papers* papers."""
+    answer = base + n_papers * per_paper
+    if GEMINI_THINKING_BUDGET is None:
+        return min(MAX_OUTPUT_TOKENS, default + answer)
+    return min(MAX_OUTPUT_TOKENS, GEMINI_THINKING_BUDGET + answer)
+
+
+def _thinking_config() -> types.ThinkingConfig | None:
+    """Thinking settings shared by every generation config (None: model default)."""
+    if GEMINI_THINKING_BUDGET is None:
+        return None
+    return types.ThinkingConfig(thinking_budget=GEMINI_THINKING_BUDGET)
+
+
+def _warn_if_truncated(
+    response: types.GenerateContentResponse,
+    config: types.GenerateContentConfig,
+) -> None:
+    """Log when *response* stopped at its ``max_output_tokens`` budget."""
+    if response.candidates and response.candidates[0].finish_reason == types.FinishReason.MAX_TOKENS:
+        log.warning("Gemini response hit max_output_tokens (%d); output is truncated",
+                    config.max_output_tokens)
+
+
+def _generate_content(
+    gemini_client: genai.Client,
+    contents: str,
+    config: types.GenerateContentConfig,
+) -> types.GenerateContentResponse:
+    """Rate-limited, retrying ``generate_content``."""
+    response = _call_with_retries(lambda: gemini_client.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=contents,
+        config=config,
+    ))
+    _warn_if_truncated(response, config)
+    return response
+
+
+def _generate_content_stream(
+    gemini_client: genai.Client,
+    contents: str,
+    config: types.GenerateContentConfig,
+) -> Iterator[str]:
+    """Rate-limited ``generate_content_stream``, yielding text as it arrives.
+
+    Retries only cover opening the stream (up to its first chunk); an error
+    after that propagates to the consumer, which keeps what it already used.
+    """
+    def open_stream():
+        stream = gemini_client.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=config,
+        )
+        return stream, next(stream, None)
 
-            raw_text = (response.text or "").strip()
-            if not raw_text:
-                log.error("Gemini returned empty response (possibly safety-filtered)")
+    stream, first = _call_with_retries(open_stream)
+    if first is None:
+        return
+    for chunk in itertools.chain((first,), stream):
+        _warn_if_truncated(chunk, config)
+        if chunk.text:
+            yield chunk.text
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_SKIP = " \t\r\n,"
+
+
+def _iter_json_array(chunks: Iterable[str]) -> Iterator[object]:
+    """Yield each element of a JSON array as soon as it has fully arrived.
+
+    *chunks* is the array's text split at arbitrary points. Raises
+    json.JSONDecodeError if the text isn't an array or ends mid-array.
+    """
+    buf = ""
+    pos = 0
+    opened = False
+    for chunk in chunks:
+        buf += chunk
+        while True:
+            while pos < len(buf) and buf[pos] in _JSON_SKIP:
+                pos += 1
+            if pos == len(buf):
+                break
+            if not opened:
+                if buf[pos] != "[":
+                    raise json.JSONDecodeError("Expected JSON array", buf, pos)
+                opened = True
+                pos += 1
                 continue
+            if buf[pos] == "]":
+                return
+            try:
+                item, pos = _JSON_DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # Element still incomplete; wait for the next chunk
+            yield item
+        # Drop consumed text so the buffer only holds the pending element
+        buf = buf[pos:]
+        pos = 0
+
+    if opened:
+        raise json.JSONDecodeError("Unterminated JSON array", buf, pos)
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Cut *text* to at most *max_bytes* of UTF-8, never mid-character."""
+    raw = text.encode("utf-8")
+    if len(raw) <= max_bytes:
+        return text
+    return raw[:max_bytes].decode("utf-8", "ignore")
+
+
+def _render_paper(p: Paper) -> str:
+    """Render one paper's classification block, byte-identical across runs.
+
+    The same paper always renders the same way, so a retried or overlapping
+    batch repeats its prompt exactly and can hit Gemini's implicit cache.
+    The "Paper <i>:" header is added per batch.
+    """
+    authors = json.dumps([clean_text(a) for a in p.authors[:15]], ensure_ascii=False)
+    block = (
+        f"  Title: {clean_text(p.title)}\n"
+        f"  Authors: {authors}\n"
+        f"  Abstract: {_truncate_utf8(clean_text(p.abstract), 400)}\n"
+        f"  Comment: {clean_text(p.comment)}\n"
+    )
+    affiliations = _stated_affiliations(p.comment)
+    if affiliations:
+        block += f"  Affiliation stated in comment: {', '.join(affiliations)}\n"
+    return block
+
+
+def _build_classification_prompt(batch: list[Paper], blocks: dict[int, str]) -> str:
+    """Assemble the user prompt for one batch from its papers' rendered *blocks*."""
+    return CLASSIFICATION_USER_PREFIX + "\n".join(
+        f"Paper {i}:\n{blocks[id(p)]}" for i, p in enumerate(batch)
+    )
 
-            classifications = json.loads(raw_text)
-            if not isinstance(classifications, list):
-                log.error("Expected JSON array from Gemini, got %s", type(classifications).__name__)
+
+def _classification_config(batch_len: int) -> types.GenerateContentConfig:
+    """Generation config shared by sync and Batch API classification requests."""
+    return types.GenerateContentConfig(
+        system_instruction=CLASSIFICATION_SYSTEM_PROMPT,
+        temperature=0.0,
+        max_output_tokens=_output_budget(
+            CLASSIFICATION_BASE_TOKENS, CLASSIFICATION_TOKENS_PER_PAPER, batch_len,
+            CLASSIFICATION_DEFAULT_TOKENS,
+        ),
+        thinking_config=_thinking_config(),
+        response_mime_type="application/json",
+    )
+
+
+def _load_json_array(text: str) -> Iterator[object]:
+    """Yield the elements of a complete JSON array response (none if blank)."""
+    if not text.strip():
+        return
+    items = orjson.loads(text)
+    if not isinstance(items, list):
+        raise json.JSONDecodeError("Expected JSON array", text, 0)
+    yield from items
+
+
+def _paper_index(item: dict, n_papers: int) -> int | None:
+    """The in-range ``paper_index`` of a response *item*, or None if unusable.
+
+    Accepts ints and numeric strings; anything else the model sends back
+    (null, floats, junk) is skipped rather than raising.
+    """
+    idx = item.get("paper_index")
+    if isinstance(idx, str) and idx.strip().isdigit():
+        idx = int(idx)
+    if isinstance(idx, int) and not isinstance(idx, bool) and 0 <= idx < n_papers:
+        return idx
+    return None
+
+
+def _apply_classifications(batch: list[Paper], items: Iterable[object]) -> None:
+    """Apply parsed classification *items* to *batch* in-place.
+
+    *items* may be parsed lazily from a live stream: each paper is updated
+    as soon as its element arrives, so a failure mid-response keeps the
+    earlier results.
+    """
+    applied = 0
+    try:
+        for item in items:
+            if not isinstance(item, dict):
                 continue
+            idx = _paper_index(item, len(batch))
+            if idx is not None:
+                classification = item.get("classification")
+                if classification not in ("industry", "academia"):
+                    classification = "unknown"
+                batch[idx].classification = classification
+                batch[idx].company = str(item.get("company") or "")
+                batch[idx].classification_reason = str(item.get("reason") or "")
+                applied += 1
+    except json.JSONDecodeError as e:  # Also covers orjson.JSONDecodeError
+        log.error("Failed to parse Gemini response as JSON: %s", e)
+        log.error("Raw response: %s", e.doc[:500])
+        return
+
+    if not applied:
+        log.error("Gemini returned no classifications (possibly safety-filtered)")
 
-            for item in classifications:
-                idx = item.get("paper_index", -1)
-                if 0 <= idx < len(batch):
-                    batch[idx]["classification"] = item.get("classification", "unknown")
-                    batch[idx]["company"] = item.get("company", "")
-                    batch[idx]["classification_reason"] = item.get("reason", "")
 
-        except json.JSONDecodeError as e:
-            log.error("Failed to parse Gemini response as JSON: %s", e)
-            raw = (getattr(response, "text", None) or "N/A")[:500]
-            log.error("Raw response: %s", raw)
-        except Exception as e:
-            log.error("Gemini API error: %s", e)
-            call_counter["count"] += 1  # Count attempted calls
+def _classify_batch(
+    batch: list[Paper],
+    prompt: str,
+    gemini_client: genai.Client,
+    call_counter: dict,
+) -> None:
+    """Stream one classification batch from Gemini, applying results in-place."""
+    _count_call(call_counter)  # Count attempted calls too
+    try:
+        chunks = _generate_content_stream(gemini_client, prompt, _classification_config(len(batch)))
+        _apply_classifications(batch, _iter_json_array(chunks))
+    except Exception as e:
+        log.error("Gemini API error: %s", e)
+
+
+def _run_batch_job(
+    gemini_client: genai.Client,
+    requests: list[types.InlinedRequest],
+    display_name: str,
+) -> list[str | None]:
+    """Submit *requests* as one Gemini Batch API job and wait for it to finish.
+
+    Every job in the process shares one deadline, BATCH_JOBS_TIMEOUT after
+    the first was submitted. Returns each request's response text, in
+    request order; None marks a request that failed (or every request, if
+    the job itself failed or ran past the deadline).
+    """
+    global _batch_deadline
+    if _batch_deadline is None:
+        _batch_deadline = time.monotonic() + BATCH_JOBS_TIMEOUT
+    failed: list[str | None] = [None] * len(requests)
+    if time.monotonic() > _batch_deadline:
+        log.error("Gemini batch deadline (%ds) already passed; not submitting %s",
+                  BATCH_JOBS_TIMEOUT, display_name)
+        return failed
+    try:
+        job = gemini_client.batches.create(
+            model=GEMINI_MODEL,
+            src=requests,
+            config={"display_name": display_name},
+        )
+        log.info("Gemini batch job %s submitted (%d requests)", job.name, len(requests))
+
+        while job.state.name not in _BATCH_DONE_STATES:
+            if time.monotonic() > _batch_deadline:
+                log.error("Gemini batch job %s still %s at the %ds batch deadline; cancelling",
+                          job.name, job.state.name, BATCH_JOBS_TIMEOUT)
+                gemini_client.batches.cancel(name=job.name)
+                return failed
+            time.sleep(BATCH_POLL_INTERVAL)
+            job = gemini_client.batches.get(name=job.name)
+    except Exception as e:
+        log.error("Gemini batch job failed: %s", e)
+        return failed
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        log.error("Gemini batch job %s ended in %s", job.name, job.state.name)
+        return failed
+
+    inlined_responses = job.dest.inlined_responses if job.dest else None
+    if not inlined_responses:
+        log.error("Gemini batch job %s succeeded but returned no responses", job.name)
+        return failed
+
+    texts: list[str | None] = []
+    for request, inlined in zip(requests, inlined_responses):
+        if inlined.error or inlined.response is None:
+            log.error("Gemini batch request failed: %s", inlined.error)
+            texts.append(None)
+        else:
+            _warn_if_truncated(inlined.response, request.config)
+            texts.append(inlined.response.text or "")
+    # Requests the job returned no response for count as failed
+    texts += [None] * (len(requests) - len(texts))
+    log.info("Gemini batch job %s succeeded", job.name)
+    return texts
+
+
+def classify_papers_with_gemini(
+    papers: list[Paper],
+    gemini_client: genai.Client,
+    call_counter: dict,
+    max_calls: int = MAX_GEMINI_CALLS,
+    use_batch: bool = False,
+) -> list[Paper]:
+    """Classify papers in batches using Gemini. Modifies papers in-place.
+
+    Batches are sent concurrently (up to MAX_CONCURRENT_BATCHES in flight),
+    paced by the shared GEMINI_RPM rate limiter. With *use_batch*, all of
+    them go out as a single asynchronous Batch API job instead.
+
+    Papers whose comment plainly states an industry affiliation are labelled
+    locally, and papers classified by an earlier run (same content hash) are
+    filled in from the persistent cache; neither is sent to Gemini.
+    """
+    if not papers:
+        return papers
 
-        time.sleep(1)
+    candidates = [p for p in papers if not _preclassify(p)]
+    if len(candidates) < len(papers):
+        log.info("Pre-classified %d of %d papers as industry from their comments",
+                 len(papers) - len(candidates), len(papers))
+
+    hashes = {id(p): paper_hash(p) for p in candidates}
+    cached = load_cached("classification", hashes.values())
+    pending: list[Paper] = []
+    for p in candidates:
+        hit = cached.get(hashes[id(p)])
+        if hit is None:
+            pending.append(p)
+        else:
+            p.classification = hit["classification"]
+            p.company = hit["company"]
+            p.classification_reason = hit["reason"]
+    if cached:
+        log.info("Gemini cache: reused %d of %d classifications", len(candidates) - len(pending), len(candidates))
+
+    total = len(pending)
+
+    # Stable order, so the same set of papers always packs into the same prompts
+    pending.sort(key=lambda p: p.id)
+    # Rendered once per paper, then reused for both packing and the prompts
+    blocks = {id(p): _render_paper(p) for p in pending}
+    batches = _pack_batches(pending, blocks)
+    if batches:
+        log.info(
+            "Gemini: packed %d papers into %d batches (%.1f papers/batch)",
+            total, len(batches), total / len(batches),
+        )
+    budget = max(0, max_calls - call_counter["count"])
+    if len(batches) > budget:
+        kept = sum(len(batch) for batch in batches[:budget])
+        log.warning(
+            "Reached Gemini call limit (%d). Papers %d-%d left unclassified.",
+            max_calls, kept, total - 1,
+        )
+        batches = batches[:budget]
+
+    prompts = [_build_classification_prompt(batch, blocks) for batch in batches]
+
+    if use_batch and batches:
+        requests = [
+            types.InlinedRequest(contents=prompt, config=_classification_config(len(batch)))
+            for batch, prompt in zip(batches, prompts)
+        ]
+        texts = _run_batch_job(gemini_client, requests, "classify-papers")
+        failed = []
+        for batch, prompt, text in zip(batches, prompts, texts):
+            if text is None:
+                failed.append((batch, prompt))
+            else:
+                _apply_classifications(batch, _load_json_array(text))
+        # Failed requests are retried synchronously below, and counted there
+        call_counter["count"] += len(requests) - len(failed)
+        if failed:
+            log.warning("Gemini: classifying %d failed batch requests synchronously", len(failed))
+        batches = [batch for batch, _ in failed]
+        prompts = [prompt for _, prompt in failed]
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as executor:
+            futures = []
+            batch_start = 0
+            for batch, prompt in zip(batches, prompts):
+                log.info(
+                    "Gemini: queueing classification of papers %d-%d of %d",
+                    batch_start, batch_start + len(batch) - 1, total,
+                )
+                batch_start += len(batch)
+                futures.append(executor.submit(
+                    _classify_batch, batch, prompt, gemini_client, call_counter,
+                ))
+            for future in as_completed(futures):
+                future.result()
+
+    # "unknown" is a last-resort answer, so leave those to be retried next run
+    store_cached("classification", {
+        hashes[id(p)]: {
+            "classification": p.classification,
+            "company": p.company,
+            "reason": p.classification_reason,
+        }
+        for p in pending
+        if p.classification and p.classification != "unknown"
+    })
 
     # Mark any unclassified papers
     for p in papers:
-        if "classification" not in p:
-            p["classification"] = "unknown"
-            p["company"] = ""
-            p["classification_reason"] = ""
+        if not p.classification:
+            p.classification = "unknown"
+            p.company = ""
+            p.classification_reason = ""
 
     return papers
 
 
+def _email_company(domain: str) -> str:
+    """Company for an email *domain* or any parent of it (``us.ibm.com``), else ""."""
+    domain = domain.lower()
+    while domain:
+        company = _COMPANY_EMAIL_DOMAINS.get(domain)
+        if company:
+            return company
+        domain = domain.partition(".")[2]
+    return ""
+
+
+def _stated_affiliations(comment: str) -> list[str]:
+    """Companies *comment* names as an affiliation ("work done at X", "X Research")."""
+    companies: list[str] = []
+    for m in _AFFILIATION_RE.finditer(comment):
+        company = m.group("after") or m.group("before")
+        if company not in companies:
+            companies.append(company)
+    return companies
+
+
+def _preclassify(p: Paper) -> bool:
+    """Label *p* industry, without Gemini, if its comment plainly says so.
+
+    That means a known company email domain and no academic affiliation
+    (named, or an academic email domain). Returns True if *p* was labelled.
+    """
+    comment = p.comment
+    if not comment or _ACADEMIC_RE.search(comment):
+        return False
+
+    companies: list[str] = []
+    for m in _EMAIL_DOMAIN_RE.finditer(comment):
+        if _ACADEMIC_DOMAIN_RE.search(m.group(1)):
+            return False
+        company = _email_company(m.group(1))
+        if company and company not in companies:
+            companies.append(company)
+    if not companies:
+        return False
+
+    p.classification = "industry"
+    p.company = ", ".join(companies)
+    p.classification_reason = "Company email address in the arXiv comment"
+    return True
+
+
+def _apply_summaries(papers: list[Paper], raw_text: str) -> None:
+    """Parse a summary response and apply it to *papers* in-place."""
+    raw_text = raw_text.strip()
+    if not raw_text:
+        log.error("Gemini returned empty summary response")
+        return
+
+    summaries = orjson.loads(raw_text)
+    if not isinstance(summaries, list):
+        log.error("Expected JSON array for summaries, got %s", type(summaries).__name__)
+        return
+
+    for item in summaries:
+        if not isinstance(item, dict):
+            continue
+        idx = _paper_index(item, len(papers))
+        if idx is not None:
+            papers[idx].summary = str(item.get("summary") or "")
+
+
 def generate_summaries(
-    industry_papers: list[dict],
+    industry_papers: list[Paper],
     gemini_client: genai.Client,
     call_counter: dict,
     max_calls: int = MAX_GEMINI_CALLS,
+    use_batch: bool = False,
 ) -> None:
-    """Use Gemini to generate a concise summary of each industry paper."""
-    if not industry_papers or call_counter["count"] >= max_calls:
+    """Use Gemini to generate a concise summary of each industry paper.
+
+    Summaries cached by an earlier run (same content hash) are reused.
+    """
+    if not industry_papers:
+        return
+
+    hashes = {id(p): paper_hash(p) for p in industry_papers}
+    cached = load_cached("summary", hashes.values())
+    pending: list[Paper] = []
+    for p in industry_papers:
+        hit = cached.get(hashes[id(p)])
+        if hit is None:
+            pending.append(p)
+        else:
+            p.summary = hit["summary"]
+    if cached:
+        log.info("Gemini cache: reused %d of %d summaries", len(industry_papers) - len(pending), len(industry_papers))
+
+    if not pending or call_counter["count"] >= max_calls:
         return
 
     cap = 30
-    if len(industry_papers) > cap:
+    if len(pending) > cap:
         log.info(
             "Limiting summary generation to first %d of %d industry papers",
-            cap, len(industry_papers),
+            cap, len(pending),
         )
+        pending = pending[:cap]
 
     papers_text = []
-    for i, p in enumerate(industry_papers[:cap]):
+    for i, p in enumerate(pending):
         papers_text.append(
             f"Paper {i}:\n"
-            f"  Title: {p['title']}\n"
-            f"  Authors: {', '.join(p['authors'][:10])}\n"
-            f"  Company: {p.get('company', 'N/A')}\n"
-            f"  Abstract: {p['abstract'][:500]}\n"
+            f"  Title: {clean_text(p.title)}\n"
+            f"  Authors: {json.dumps([clean_text(a) for a in p.authors[:10]], ensure_ascii=False)}\n"
+            f"  Company: {clean_text(p.company)}\n"
+            f"  Abstract: {_truncate_utf8(clean_text(p.abstract), 500)}\n"
         )
 
-    prompt = (
-        "For each paper below, write a 2-3 sentence summary highlighting "
-        "the key contribution and why it matters for recommendation systems, "
-        "information retrieval, or LLM research. "
-        "Focus on practical implications.\n\n"
-        + "\n".join(papers_text)
-        + '\n\nReturn a JSON array: [{"paper_index": <int>, "summary": "..."}]'
+    prompt = SUMMARY_USER_PREFIX + "\n".join(papers_text)
+    config = types.GenerateContentConfig(
+        system_instruction=SUMMARY_SYSTEM_PROMPT,
+        temperature=0.3,
+        max_output_tokens=_output_budget(
+            SUMMARY_BASE_TOKENS, SUMMARY_TOKENS_PER_PAPER, len(pending),
+            SUMMARY_DEFAULT_TOKENS,
+        ),
+        thinking_config=_thinking_config(),
+        response_mime_type="application/json",
     )
 
-    response = None
     try:
-        response = gemini_client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.3,
-                max_output_tokens=8192,
-                response_mime_type="application/json",
-            ),
-        )
-        call_counter["count"] += 1
-
-        raw_text = (response.text or "").strip()
-        if not raw_text:
-            log.error("Gemini returned empty summary response")
-            return
+        raw_text = None
+        if use_batch:
+            [raw_text] = _run_batch_job(
+                gemini_client,
+                [types.InlinedRequest(contents=prompt, config=config)],
+                "summarize-papers",
+            )
+            if raw_text is None:
+                log.warning("Gemini: generating summaries synchronously after the batch request failed")
+            else:
+                _count_call(call_counter)
+        if raw_text is None:
+            response = _generate_content(gemini_client, prompt, config)
+            _count_call(call_counter)
+            raw_text = response.text or ""
 
-        summaries = json.loads(raw_text)
-        if not isinstance(summaries, list):
-            log.error("Expected JSON array for summaries, got %s", type(summaries).__name__)
-            return
-
-        for item in summaries:
-            raw_idx = item.get("paper_index")
-            if raw_idx is None:
-                continue
-            idx = int(raw_idx)
-            if 0 <= idx < len(industry_papers):
-                industry_papers[idx]["summary"] = item.get("summary", "")
+        _apply_summaries(pending, raw_text)
 
     except Exception as e:
         log.error("Summary generation failed: %s", e)
-        call_counter["count"] += 1  # Count attempted calls
+        _count_call(call_counter)  # Count attempted calls
+
+    store_cached("summary", {hashes[id(p)]: {"summary": p.summary} for p in pending if p.summary})
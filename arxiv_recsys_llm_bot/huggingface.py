@@ -1,62 +1,76 @@
 """Fetch trending papers from HuggingFace Daily Papers."""
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
-from arxiv_recsys_llm_bot.config import HF_RELEVANCE_KEYWORDS, log
+from arxiv_recsys_llm_bot.config import HF_RELEVANCE_PATTERN, log
+from arxiv_recsys_llm_bot.dedup import normalize_arxiv_id
+from arxiv_recsys_llm_bot.models import Paper, clean_text
 
 HF_DAILY_PAPERS_URL = "https://huggingface.co/api/daily_papers"
 
+# Shared across calls so repeat requests reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "arxiv-recsys-llm-bot (+https://github.com/peterhannh/arxiv-recsys-llm-bot)"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 def _is_relevant(title: str, abstract: str) -> bool:
     """Check if a paper matches RecSys/LLM/IR keywords."""
-    text = f"{title} {abstract}".lower()
-    return any(kw in text for kw in HF_RELEVANCE_KEYWORDS)
+    # Title first: most relevant papers hit there, skipping the abstract scan
+    search = HF_RELEVANCE_PATTERN.search
+    return search(title.lower()) is not None or search(abstract.lower()) is not None
 
 
-def fetch_huggingface_papers() -> list[dict]:
+def fetch_huggingface_papers() -> list[Paper]:
     """Fetch today's HuggingFace Daily Papers, filtered for relevance."""
     try:
-        resp = requests.get(HF_DAILY_PAPERS_URL, timeout=30)
+        resp = _SESSION.get(HF_DAILY_PAPERS_URL, timeout=30)
         resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
+        data = orjson.loads(resp.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         log.warning("HuggingFace Daily Papers fetch failed: %s", e)
         return []
 
-    papers: list[dict] = []
+    papers: list[Paper] = []
     seen_ids: set[str] = set()
 
     for entry in data:
         paper = entry.get("paper") or {}
-        arxiv_id = paper.get("id", "")
+        # Canonical (versionless) ID, so it keys the same as the ArXiv fetcher's
+        arxiv_id = normalize_arxiv_id(paper.get("id", ""))
         if not arxiv_id or arxiv_id in seen_ids:
             continue
         seen_ids.add(arxiv_id)
 
-        title = (paper.get("title") or "").replace("\n", " ").strip()
-        abstract = (paper.get("summary") or "").replace("\n", " ").strip()
-
-        if not title or not _is_relevant(title, abstract):
+        title = clean_text(paper.get("title"))
+        if not title:
             continue
+        abstract = clean_text(paper.get("summary"))
+        if not _is_relevant(title, abstract):
+            continue
+
+        # Only relevant papers get this far; "name" is almost always present
+        raw_authors = paper.get("authors") or ()
+        try:
+            authors = [a["name"] for a in raw_authors]
+        except KeyError:
+            authors = [a.get("name", "") for a in raw_authors]
 
-        authors = [a.get("name", "") for a in (paper.get("authors") or [])]
-        upvotes = paper.get("upvotes", 0)
-        if upvotes == 0:
-            upvotes = entry.get("numUpvotes", 0)
-
-        papers.append({
-            "id": arxiv_id,
-            "title": title,
-            "authors": authors,
-            "abstract": abstract,
-            "categories": [],
-            "published": paper.get("publishedAt", "")[:10],
-            "url": f"https://arxiv.org/abs/{arxiv_id}",
-            "pdf_url": f"https://arxiv.org/pdf/{arxiv_id}",
-            "comment": "",
-            "hf_upvotes": upvotes,
-            "source": "hf",
-        })
+        papers.append(Paper(
+            id=arxiv_id,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            categories=[],
+            published=paper.get("publishedAt", "")[:10],
+            url=f"https://arxiv.org/abs/{arxiv_id}",
+            pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+            comment="",
+            hf_upvotes=paper.get("upvotes") or entry.get("numUpvotes", 0),
+            source="hf",
+        ))
 
     log.info("HuggingFace: fetched %d relevant papers", len(papers))
     return papers
@@ -2,19 +2,30 @@
 
 import argparse
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 
 from google import genai
 
-from arxiv_recsys_llm_bot.config import GEMINI_API_KEY, MAX_GEMINI_CALLS, log
+from arxiv_recsys_llm_bot.config import GEMINI_API_KEY, LOCAL_TZ, MAX_GEMINI_CALLS, log
 from arxiv_recsys_llm_bot.dedup import deduplicate_papers
 from arxiv_recsys_llm_bot.fetcher import fetch_recent_papers
 from arxiv_recsys_llm_bot.formatter import format_email_html
 from arxiv_recsys_llm_bot.gemini import classify_papers_with_gemini, generate_summaries
 from arxiv_recsys_llm_bot.huggingface import fetch_huggingface_papers
 from arxiv_recsys_llm_bot.output import save_report, send_email
-from arxiv_recsys_llm_bot.state import get_lookback_cutoff, save_state
+from arxiv_recsys_llm_bot.state import (
+    get_lookback_cutoff,
+    load_recent_ids,
+    load_state,
+    save_state,
+    update_recent_ids,
+)
+
+# Seconds to wait for a background email send once the report is saved
+EMAIL_JOIN_TIMEOUT = 30
 
 
 def main():
@@ -35,6 +46,11 @@ def main():
         "--max-gemini-calls", type=int, default=MAX_GEMINI_CALLS,
         help=f"Max Gemini API calls (default: {MAX_GEMINI_CALLS})",
     )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Send Gemini requests as an asynchronous Batch API job "
+             "(about half the cost, but can take minutes to hours)",
+    )
     args = parser.parse_args()
 
     # Validate required config
@@ -50,13 +66,17 @@ def main():
     # Determine cutoff date (state-aware, no gaps)
     cutoff = get_lookback_cutoff(args.lookback_days)
 
-    # 1a. Fetch papers from ArXiv
-    log.info("Step 1a: Fetching papers from ArXiv...")
-    arxiv_papers = fetch_recent_papers(cutoff)
-
-    # 1b. Fetch papers from HuggingFace Daily Papers
+    # 1a/1b. Fetch papers from ArXiv and HuggingFace Daily Papers concurrently.
+    # Skip ArXiv papers already delivered by recent runs. An explicit
+    # --lookback-days is treated as a backfill, so it sees everything again.
+    skip_ids = load_recent_ids() if args.lookback_days is None else set()
+    log.info("Step 1a: Fetching papers from ArXiv (skipping %d recently delivered)...", len(skip_ids))
     log.info("Step 1b: Fetching papers from HuggingFace Daily Papers...")
-    hf_papers = fetch_huggingface_papers()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        arxiv_future = executor.submit(fetch_recent_papers, cutoff, skip_ids)
+        hf_future = executor.submit(fetch_huggingface_papers)
+        arxiv_papers = arxiv_future.result()
+        hf_papers = hf_future.result()
 
     # 1c. Combine + deduplicate (ArXiv first for richest metadata, then HF)
     log.info("Step 1c: Deduplicating papers...")
@@ -72,20 +92,19 @@ def main():
     # 2. Classify with Gemini
     log.info("Step 2: Classifying %d papers with Gemini...", len(papers))
     gemini_client = genai.Client(api_key=GEMINI_API_KEY)
-    classify_papers_with_gemini(papers, gemini_client, call_counter, max_calls)
+    classify_papers_with_gemini(papers, gemini_client, call_counter, max_calls, args.batch)
 
-    industry_papers = [p for p in papers if p.get("classification") == "industry"]
+    industry_papers = [p for p in papers if p.classification == "industry"]
+    class_counts = Counter(p.classification for p in papers)
     log.info(
         "Classification results: %d industry, %d academia, %d unknown",
-        len(industry_papers),
-        sum(1 for p in papers if p.get("classification") == "academia"),
-        sum(1 for p in papers if p.get("classification") == "unknown"),
+        class_counts["industry"], class_counts["academia"], class_counts["unknown"],
     )
 
     # 3. Generate summaries for industry papers
     if industry_papers:
         log.info("Step 3: Generating summaries for %d industry papers...", len(industry_papers))
-        generate_summaries(industry_papers, gemini_client, call_counter, max_calls)
+        generate_summaries(industry_papers, gemini_client, call_counter, max_calls, args.batch)
 
     log.info("Total Gemini API calls used: %d / %d", call_counter["count"], max_calls)
 
@@ -93,14 +112,29 @@ def main():
     log.info("Step 4: Formatting email...")
     html_report = format_email_html(industry_papers, len(papers), cutoff)
 
-    # 5. Save locally (always)
-    report_path = save_report(html_report, industry_papers)
-
-    # 6. Send email
+    # 5. Send email on a background thread, so SMTP overlaps the local save
+    email_thread = None
+    email_sent = []
+    delivered = False
     if not args.dry_run and not args.no_email:
-        today = datetime.now(ZoneInfo("America/Los_Angeles")).strftime("%b %d")
+        today = datetime.now(LOCAL_TZ).strftime("%b %d")
         subject = f"RecSys & LLM Industry Papers - {today} ({len(industry_papers)} papers)"
-        if send_email(html_report, subject):
+        email_thread = threading.Thread(
+            target=lambda: email_sent.append(send_email(html_report, subject)),
+            daemon=True,
+        )
+        email_thread.start()
+
+    # 6. Save locally (always)
+    report_path = save_report(html_report, industry_papers)
+
+    if email_thread is not None:
+        email_thread.join(timeout=EMAIL_JOIN_TIMEOUT)
+        if email_thread.is_alive():
+            log.warning("Email still sending after %ds; not waiting for it. Report saved at: %s",
+                        EMAIL_JOIN_TIMEOUT, report_path)
+        elif email_sent and email_sent[0]:
+            delivered = True
             log.info("Done! Check your inbox.")
         else:
             log.info("Email not sent. Report saved at: %s", report_path)
@@ -109,25 +143,36 @@ def main():
 
     # 7. Update state (only on non-dry-run)
     if not args.dry_run:
+        now = datetime.now(timezone.utc)
+        # Only papers actually emailed count as delivered; otherwise the next
+        # run's overlapping window fetches them again. Papers left "unknown"
+        # (failed batch, call limit) aren't recorded either, so they're retried.
+        if delivered:
+            classified_ids = [p.id for p in papers if p.classification in ("industry", "academia")]
+            recent_ids = update_recent_ids(classified_ids, now)
+        else:
+            recent_ids = load_state().get("recent_ids", {})
         save_state({
-            "last_run_date": datetime.now(timezone.utc).isoformat(),
+            "last_run_date": now.isoformat(),
+            "last_run_epoch": now.timestamp(),
             "last_run_papers": len(papers),
             "last_run_industry": len(industry_papers),
+            "recent_ids": recent_ids,
         })
-        log.info("State updated: next run will pick up from %s", datetime.now(timezone.utc).date())
+        log.info("State updated: next run will pick up from %s", now.date())
 
     # Print quick summary to stdout
-    hf_count = sum(1 for p in papers if "hf" in p.get("source", ""))
+    # Merged papers carry a comma-separated source list
+    source_counts = Counter(src for p in papers for src in p.source.split(","))
     print(f"\n{'='*60}")
     print(f"  {len(industry_papers)} industry papers found (out of {len(papers)} total)")
     print(f"  Sources: ArXiv={len(arxiv_papers)}, HF={len(hf_papers)} (pre-dedup)")
-    print(f"  After dedup: {len(papers)} unique | HF-trending: {hf_count}")
+    print(f"  After dedup: {len(papers)} unique | HF-trending: {source_counts['hf']}")
     print(f"  Gemini API calls: {call_counter['count']} / {max_calls}")
     print(f"  Report: {report_path}")
     print(f"{'='*60}\n")
 
     for p in industry_papers:
-        company = p.get("company", "")
-        label = f"[{company}]" if company else "[industry]"
-        print(f"  {label} {p['title']}")
-        print(f"    {p['url']}\n")
+        label = f"[{p.company}]" if p.company else "[industry]"
+        print(f"  {label} {p.title}")
+        print(f"    {p.url}\n")
@@ -0,0 +1,32 @@
+"""Paper record shared by the fetchers, dedup, Gemini and formatting stages."""
+
+from dataclasses import dataclass
+
+
+def clean_text(text: str | None) -> str:
+    """Collapse every whitespace run (newlines, tabs, repeats) to one space and trim."""
+    return " ".join(text.split()) if text else ""
+
+
+@dataclass(slots=True)
+class Paper:
+    """A single paper from any source, enriched in-place as the pipeline runs."""
+
+    id: str
+    title: str
+    authors: list[str]
+    abstract: str
+    categories: list[str]
+    published: str
+    url: str
+    pdf_url: str
+    comment: str
+    source: str
+    doi: str = ""
+    hf_upvotes: int = 0
+
+    # Filled in by Gemini classification / summary generation
+    classification: str = ""
+    company: str = ""
+    classification_reason: str = ""
+    summary: str = ""
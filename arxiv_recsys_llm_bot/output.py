@@ -1,18 +1,44 @@
 """Email sending and local report saving."""
 
-import json
+import os
 import smtplib
+import ssl
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 from email.message import EmailMessage
 from pathlib import Path
 
+import orjson
+
 from arxiv_recsys_llm_bot.config import (
     GMAIL_APP_PASSWORD,
+    LOCAL_TZ,
     RECIPIENT_EMAIL,
+    REPORTS_DIR,
     SENDER_EMAIL,
     log,
 )
+from arxiv_recsys_llm_bot.models import Paper
+
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 587
+
+# Built once at import rather than on every STARTTLS
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+@contextmanager
+def _smtp_session() -> Iterator[smtplib.SMTP]:
+    """Yield a Gmail SMTP connection that is already upgraded to TLS and logged in.
+
+    Send every message for a run inside one session to pay the handshake once.
+    """
+    with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
+        server.starttls(context=_SSL_CONTEXT)
+        server.login(SENDER_EMAIL, GMAIL_APP_PASSWORD)
+        yield server
 
 
 def send_email(html_content: str, subject: str) -> bool:
@@ -44,9 +70,7 @@ def send_email(html_content: str, subject: str) -> bool:
     msg.add_alternative(html_content, subtype="html")
 
     try:
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(SENDER_EMAIL, GMAIL_APP_PASSWORD)
+        with _smtp_session() as server:
             server.send_message(msg)
         log.info("Email sent successfully to %s", RECIPIENT_EMAIL)
         return True
@@ -55,21 +79,38 @@ def send_email(html_content: str, subject: str) -> bool:
         return False
 
 
-def save_report(html_content: str, industry_papers: list[dict]) -> Path:
-    """Save the HTML report and a JSON dump locally."""
-    report_dir = Path(__file__).resolve().parent.parent / "reports"
-    report_dir.mkdir(exist_ok=True)
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a temp file, so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
-    date_str = datetime.now(ZoneInfo("America/Los_Angeles")).strftime("%Y-%m-%d")
 
-    html_path = report_dir / f"recsys-llm-industry-{date_str}.html"
-    html_path.write_text(html_content, encoding="utf-8")
+def save_report(html_content: str, industry_papers: list[Paper]) -> Path:
+    """Save the HTML report, a JSON dump and a JSON Lines dump locally."""
+    REPORTS_DIR.mkdir(exist_ok=True)
 
-    json_path = report_dir / f"recsys-llm-industry-{date_str}.json"
-    json_path.write_text(
-        json.dumps(industry_papers, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    date_str = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d")
+
+    html_path = REPORTS_DIR / f"recsys-llm-industry-{date_str}.html"
+    json_path = REPORTS_DIR / f"recsys-llm-industry-{date_str}.json"
+    # One paper per line, so consumers can stream it instead of loading it whole
+    jsonl_path = REPORTS_DIR / f"recsys-llm-industry-{date_str}.jsonl"
+
+    # Encode/serialize and write the files concurrently. orjson serializes
+    # the Paper dataclasses directly, as UTF-8 bytes.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(lambda: _write_atomic(html_path, html_content.encode("utf-8"))),
+            executor.submit(lambda: _write_atomic(
+                json_path, orjson.dumps(industry_papers, option=orjson.OPT_INDENT_2),
+            )),
+            executor.submit(lambda: _write_atomic(jsonl_path, b"".join(
+                orjson.dumps(p, option=orjson.OPT_APPEND_NEWLINE) for p in industry_papers
+            ))),
+        ]
+        for future in futures:
+            future.result()
 
     log.info("Report saved to %s", html_path)
     return html_path
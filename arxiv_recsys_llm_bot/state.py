@@ -1,24 +1,47 @@
 """State management — ensures no gap dates between runs."""
 
-import json
 from datetime import datetime, timedelta, timezone
 
-from arxiv_recsys_llm_bot.config import STATE_FILE, log
+import orjson
+
+from arxiv_recsys_llm_bot.config import RECENT_IDS_DAYS, STATE_FILE, log
 
 
 def load_state() -> dict:
     """Load the last run state from disk."""
     if STATE_FILE.exists():
         try:
-            return json.loads(STATE_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
+            return orjson.loads(STATE_FILE.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
             pass
     return {}
 
 
 def save_state(state: dict) -> None:
     """Persist run state to disk."""
-    STATE_FILE.write_text(json.dumps(state, indent=2) + "\n")
+    STATE_FILE.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2) + b"\n")
+
+
+def load_recent_ids() -> set[str]:
+    """Return the ArXiv IDs delivered by runs in the last RECENT_IDS_DAYS days."""
+    recent = load_state().get("recent_ids", {})
+    return {pid for pids in recent.values() for pid in pids}
+
+
+def update_recent_ids(ids: list[str], now: datetime) -> dict[str, list[str]]:
+    """Record *ids* under today's date, dropping days older than RECENT_IDS_DAYS.
+
+    Returns the ``recent_ids`` mapping (date -> sorted IDs) to store in state.
+    """
+    oldest = (now - timedelta(days=RECENT_IDS_DAYS)).date().isoformat()
+    recent = {
+        day: pids
+        for day, pids in load_state().get("recent_ids", {}).items()
+        if day >= oldest
+    }
+    today = now.date().isoformat()
+    recent[today] = sorted(set(recent.get(today, [])) | set(ids))
+    return recent
 
 
 def get_lookback_cutoff(force_lookback_days: int | None = None) -> datetime:
@@ -27,7 +50,8 @@ def get_lookback_cutoff(force_lookback_days: int | None = None) -> datetime:
 
     Priority:
       1. If --lookback-days is explicitly given, use that.
-      2. Otherwise read last_run_date from state.json and fetch from there.
+      2. Otherwise read last_run_epoch (or, from older state files,
+         last_run_date) from state.json and fetch from there.
       3. If no state exists, default to 3 days ago.
     """
     if force_lookback_days is not None:
@@ -37,16 +61,20 @@ def get_lookback_cutoff(force_lookback_days: int | None = None) -> datetime:
 
     state = load_state()
     last_run = state.get("last_run_date")
-    if last_run:
-        cutoff = datetime.fromisoformat(last_run)
-        if cutoff.tzinfo is None:
-            cutoff = cutoff.replace(tzinfo=timezone.utc)
+    last_run_epoch = state.get("last_run_epoch")
+    if last_run_epoch or last_run:
+        if last_run_epoch:
+            cutoff = datetime.fromtimestamp(last_run_epoch, tz=timezone.utc)
+        else:
+            cutoff = datetime.fromisoformat(last_run)
+            if cutoff.tzinfo is None:
+                cutoff = cutoff.replace(tzinfo=timezone.utc)
         # ArXiv publishes in daily batches (~20:00 ET / 01:00 UTC).
         # Paper timestamps reflect submission time, which can be 1-3 days
         # before announcement (especially over weekends).  Use a 48-hour
         # overlap to cover weekend gaps and boundary edge cases.
         cutoff -= timedelta(hours=48)
-        log.info("Resuming from last run: %s (cutoff %s)", last_run, cutoff.isoformat())
+        log.info("Resuming from last run: %s (cutoff %s)", last_run or last_run_epoch, cutoff.isoformat())
         return cutoff
 
     # First run ever — default to 3 days (covers weekend gaps)